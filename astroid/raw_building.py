@@ -25,6 +25,7 @@ import inspect
 import os
 import sys
 import types
+import weakref
 
 from astroid import bases
 from astroid import manager
@@ -36,7 +37,9 @@ MANAGER = manager.AstroidManager()
 # the keys of CONST_CLS eg python builtin types
 
 _CONSTANTS = tuple(node_classes.CONST_CLS)
-_BUILTINS = vars(builtins)
+_BUILTIN_NAMES = frozenset(vars(builtins))
+# modules whose living name differs from the astroid one
+_MODNAME_ALIASES = {"gtk": "gtk_gtk", "_io": "io"}
 TYPE_NONE = type(None)
 TYPE_NOTIMPLEMENTED = type(NotImplemented)
 TYPE_ELLIPSIS = type(...)
@@ -54,7 +57,7 @@ def _io_discrepancy(member):
 
 
 def _attach_local_node(parent, node, name):
-    node.name = name  # needed by add_local_node
+    node.name = name = sys.intern(name)  # needed by add_local_node
     parent.add_local_node(node)
 
 
@@ -82,7 +85,8 @@ def attach_dummy_node(node, name, runtime_object=_marker):
 
 
 def _has_underlying_object(self):
-    return self.object is not None and self.object is not _marker
+    obj = self.object
+    return obj is not None and obj is not _marker
 
 
 nodes.EmptyNode.has_underlying_object = _has_underlying_object
@@ -129,25 +133,29 @@ def build_function(name, args=None, posonlyargs=None, defaults=None, doc=None):
     # first argument is now a list of decorators
     func = nodes.FunctionDef(name, doc)
     func.args = argsnode = nodes.Arguments()
+    # build the argument nodes and register them as locals in a single
+    # pass instead of walking the list again through register_arguments
     argsnode.args = []
-    argsnode.posonlyargs = []
     for arg in args:
-        argsnode.args.append(nodes.Name())
-        argsnode.args[-1].name = arg
-        argsnode.args[-1].parent = argsnode
+        argnode = nodes.Name()
+        argnode.name = arg
+        argnode.parent = argsnode
+        argsnode.args.append(argnode)
+        func.set_local(arg, argnode)
+    argsnode.posonlyargs = []
     for arg in posonlyargs:
-        argsnode.posonlyargs.append(nodes.Name())
-        argsnode.posonlyargs[-1].name = arg
-        argsnode.posonlyargs[-1].parent = argsnode
+        argnode = nodes.Name()
+        argnode.name = arg
+        argnode.parent = argsnode
+        argsnode.posonlyargs.append(argnode)
     argsnode.defaults = []
     for default in defaults:
-        argsnode.defaults.append(nodes.const_factory(default))
-        argsnode.defaults[-1].parent = argsnode
+        defaultnode = nodes.const_factory(default)
+        defaultnode.parent = argsnode
+        argsnode.defaults.append(defaultnode)
     argsnode.kwarg = None
     argsnode.vararg = None
     argsnode.parent = func
-    if args:
-        register_arguments(func)
     return func
 
 
@@ -168,11 +176,15 @@ def register_arguments(func, args=None):
             func.set_local(func.args.vararg, func.args)
         if func.args.kwarg:
             func.set_local(func.args.kwarg, func.args)
-    for arg in args:
-        if isinstance(arg, nodes.Name):
-            func.set_local(arg.name, arg)
-        else:
-            register_arguments(func, arg.elts)
+    # walk nested argument lists with an explicit stack rather than
+    # recursive calls, sparing a frame per nesting level
+    stack = [args]
+    while stack:
+        for arg in stack.pop():
+            if isinstance(arg, nodes.Name):
+                func.set_local(arg.name, arg)
+            else:
+                stack.append(arg.elts)
 
 
 def object_build_class(node, member, localname):
@@ -181,8 +193,22 @@ def object_build_class(node, member, localname):
     return _base_class_object_build(node, member, basenames, localname=localname)
 
 
-def object_build_function(node, member, localname):
-    """create astroid for a living function object"""
+_function_arguments_cache = weakref.WeakKeyDictionary()
+
+
+def _function_arguments(member):
+    """parse the signature of a living function into argument lists
+
+    The same function objects show up repeatedly while inspecting large
+    module trees (helpers shared between modules, bound methods of common
+    classes), so the parsed form is kept in a process-wide weak-keyed
+    cache: an entry lives exactly as long as the function it describes,
+    without pinning the function (or its module globals) in memory.
+    """
+    try:
+        return _function_arguments_cache[member]
+    except KeyError:
+        pass
     signature = inspect.signature(member)
     args = []
     defaults = []
@@ -198,6 +224,14 @@ def object_build_function(node, member, localname):
             args.append(param_name)
         if param.default is not inspect._empty:
             defaults.append(param.default)
+    result = (tuple(args), tuple(posonlyargs), tuple(defaults))
+    _function_arguments_cache[member] = result
+    return result
+
+
+def object_build_function(node, member, localname):
+    """create astroid for a living function object"""
+    args, posonlyargs, defaults = _function_arguments(member)
     func = build_function(
         getattr(member, "__name__", None) or localname,
         args,
@@ -226,6 +260,14 @@ def object_build_methoddescriptor(node, member, localname):
     _add_dunder_class(func, member)
 
 
+def _build_instance_attr(obj, klass):
+    valnode = nodes.EmptyNode()
+    valnode.object = obj
+    valnode.parent = klass
+    valnode.lineno = 1
+    return valnode
+
+
 def _base_class_object_build(node, member, basenames, name=None, localname=None):
     """create astroid for a living class object, with a given set of base names
     (e.g. ancestors)
@@ -237,24 +279,20 @@ def _base_class_object_build(node, member, basenames, name=None, localname=None)
     )
     klass._newstyle = isinstance(member, type)
     node.add_local_node(klass, localname)
-    try:
+    if isinstance(member, type) and issubclass(member, Exception):
         # limit the instantiation trick since it's too dangerous
         # (such as infinite test execution...)
         # this at least resolves common case such as Exception.args,
         # OSError.errno
-        if issubclass(member, Exception):
+        try:
             instdict = member().__dict__
-        else:
-            raise TypeError
-    except TypeError:
-        pass
-    else:
-        for item_name, obj in instdict.items():
-            valnode = nodes.EmptyNode()
-            valnode.object = obj
-            valnode.parent = klass
-            valnode.lineno = 1
-            klass.instance_attrs[item_name] = [valnode]
+        except TypeError:
+            instdict = None
+        if instdict:
+            klass.instance_attrs = {
+                item_name: [_build_instance_attr(obj, klass)]
+                for item_name, obj in instdict.items()
+            }
     return klass
 
 
@@ -293,6 +331,11 @@ class InspectBuilder:
     def __init__(self):
         self._done = {}
         self._module = None
+        self._io_cache = {}
+        self._modname_cache = {}
+        self._import_probe_cache = {}
+        # pin the cached members so the id() keys above cannot be reused
+        self._cache_refs = []
 
     def inspect_build(self, module, modname=None, path=None):
         """build astroid from a living module (i.e. using inspect)
@@ -312,46 +355,83 @@ class InspectBuilder:
         MANAGER.cache_module(node)
         node.package = hasattr(module, "__path__")
         self._done = {}
+        self._io_cache = {}
+        self._modname_cache = {}
+        self._import_probe_cache = {}
+        self._cache_refs = []
         self.object_build(node, module)
         return node
 
+    def _cached_io_discrepancy(self, member):
+        """per-build memoized version of _io_discrepancy"""
+        key = id(member)
+        try:
+            return self._io_cache[key]
+        except KeyError:
+            result = self._io_cache[key] = _io_discrepancy(member)
+            self._cache_refs.append(member)
+            return result
+
+    def _member_module_name(self, member):
+        """return the member's __module__, memoized for the current build"""
+        key = id(member)
+        try:
+            return self._modname_cache[key]
+        except KeyError:
+            # /!\ some classes like ExtensionClass doesn't have a __module__
+            # attribute ! Also, this may trigger an exception on badly built
+            # module (see http://www.logilab.org/ticket/57299 for instance)
+            try:
+                modname = getattr(member, "__module__", None)
+            except TypeError:
+                modname = None
+            self._modname_cache[key] = modname
+            self._cache_refs.append(member)
+            return modname
+
     def object_build(self, node, obj):
         """recursive method which create a partial ast from real objects
          (only function, class, and method are handled)
         """
-        if obj in self._done:
-            return self._done[obj]
-        self._done[obj] = node
-        for name in dir(obj):
-            try:
-                member = getattr(obj, name)
-            except AttributeError:
-                # damned ExtensionClass.Base, I know you're there !
-                attach_dummy_node(node, name)
+        # keyed by id() so that visiting an object never runs a custom (or
+        # missing) __hash__; _cache_refs pins the object against id reuse
+        if id(obj) in self._done:
+            return self._done[id(obj)]
+        self._done[id(obj)] = node
+        self._cache_refs.append(obj)
+        if inspect.ismodule(obj):
+            # fast path: module attribute access is a plain __dict__ lookup,
+            # so iterate the dict directly instead of paying a full getattr
+            # (descriptor protocol included) for every dir() entry
+            members = list(vars(obj).items())
+        else:
+            members = []
+            for name in dir(obj):
+                # sentinel-default getattr spares a try/except per name
+                member = getattr(obj, name, _marker)
+                if member is _marker:
+                    # damned ExtensionClass.Base, I know you're there !
+                    attach_dummy_node(node, name)
+                else:
+                    members.append((name, member))
+        for name, member in members:
+            # interned names hit the pointer-equality fast path in every
+            # locals dict probe they are used for downstream
+            name = sys.intern(name)
+            # common member types resolve through a single type() lookup
+            # instead of the chain of inspect.is* predicates below
+            handler = self._member_dispatch.get(type(member))
+            if handler is not None:
+                handler(self, node, name, member)
                 continue
             if inspect.ismethod(member):
                 member = member.__func__
             if inspect.isfunction(member):
-                _build_from_function(node, name, member, self._module)
+                self._build_function_member(node, name, member)
             elif inspect.isbuiltin(member):
-                if not _io_discrepancy(member) and self.imported_member(
-                    node, member, name
-                ):
-                    continue
-                object_build_methoddescriptor(node, member, name)
+                self._build_builtin_member(node, name, member)
             elif inspect.isclass(member):
-                if self.imported_member(node, member, name):
-                    continue
-                if member in self._done:
-                    class_node = self._done[member]
-                    if class_node not in node.locals.get(name, ()):
-                        node.add_local_node(class_node, name)
-                else:
-                    class_node = object_build_class(node, member, name)
-                    # recursion
-                    self.object_build(class_node, member)
-                if name == "__class__" and class_node.parent is None:
-                    class_node.parent = self._done[self._module]
+                self._build_class_member(node, name, member)
             elif inspect.ismethoddescriptor(member):
                 assert isinstance(member, object)
                 object_build_methoddescriptor(node, member, name)
@@ -365,24 +445,68 @@ class InspectBuilder:
                 # methods aren't caught by isbuiltin branch.
                 _build_from_function(node, name, member, self._module)
             elif _safe_has_attribute(member, "__all__"):
-                module = build_module(name)
-                _attach_local_node(node, module, name)
-                # recursion
-                self.object_build(module, member)
+                cached = None
+                if inspect.ismodule(member) and member is not self._module:
+                    # modules inspected by a previous build (or parsed from
+                    # source) are already cached by the manager
+                    cached = MANAGER.astroid_cache.get(
+                        getattr(member, "__name__", None)
+                    )
+                if cached is not None:
+                    # reference the cached node instead of populating a
+                    # fresh stub; set_local leaves its name and parent alone
+                    node.set_local(name, cached)
+                else:
+                    module = build_module(name)
+                    _attach_local_node(node, module, name)
+                    # recursion
+                    self.object_build(module, member)
             else:
                 # create an empty node so that the name is actually defined
                 attach_dummy_node(node, name, member)
         return None
 
+    def _build_function_member(self, node, name, member):
+        _build_from_function(node, name, member, self._module)
+
+    def _build_builtin_member(self, node, name, member):
+        if not self._cached_io_discrepancy(member) and self.imported_member(
+            node, member, name
+        ):
+            return
+        object_build_methoddescriptor(node, member, name)
+
+    def _build_class_member(self, node, name, member):
+        # consult the dedup cache before anything else: a class already in
+        # _done was necessarily built locally, so neither import probing nor
+        # node allocation is needed to reuse it
+        class_node = self._done.get(id(member))
+        if class_node is None:
+            if self.imported_member(node, member, name):
+                return
+            class_node = object_build_class(node, member, name)
+            # recursion
+            self.object_build(class_node, member)
+        elif class_node not in node.locals.get(name, ()):
+            node.add_local_node(class_node, name)
+        if name == "__class__" and class_node.parent is None:
+            class_node.parent = self._done[id(self._module)]
+
+    def _build_const_member(self, node, name, member):
+        attach_const_node(node, name, member)
+
+    # members whose exact type appears here skip the inspect.is* cascade;
+    # subclasses and exotic types still go through the predicate chain
+    _member_dispatch = {
+        types.FunctionType: _build_function_member,
+        types.BuiltinFunctionType: _build_builtin_member,
+        type: _build_class_member,
+    }
+    _member_dispatch.update(dict.fromkeys(node_classes.CONST_CLS, _build_const_member))
+
     def imported_member(self, node, member, name):
         """verify this is not an imported class or handle it"""
-        # /!\ some classes like ExtensionClass doesn't have a __module__
-        # attribute ! Also, this may trigger an exception on badly built module
-        # (see http://www.logilab.org/ticket/57299 for instance)
-        try:
-            modname = getattr(member, "__module__", None)
-        except TypeError:
-            modname = None
+        modname = self._member_module_name(member)
         if modname is None:
             if name in ("__new__", "__subclasshook__"):
                 # Python 2.5.1 (r251:54863, Sep  1 2010, 22:03:14)
@@ -393,17 +517,26 @@ class InspectBuilder:
                 attach_dummy_node(node, name, member)
                 return True
 
-        real_name = {"gtk": "gtk_gtk", "_io": "io"}.get(modname, modname)
+        real_name = _MODNAME_ALIASES.get(modname, modname)
 
         if real_name != self._module.__name__:
             # check if it sounds valid and then add an import node, else use a
-            # dummy node
-            try:
-                getattr(sys.modules[modname], name)
-            except (KeyError, AttributeError):
-                attach_dummy_node(node, name, member)
-            else:
+            # dummy node; the probe is cached since the same (module, name)
+            # pairs come back over and over during a wide inspection
+            key = (modname, name)
+            found = self._import_probe_cache.get(key)
+            if found is None:
+                try:
+                    getattr(sys.modules[modname], name)
+                except (KeyError, AttributeError):
+                    found = False
+                else:
+                    found = True
+                self._import_probe_cache[key] = found
+            if found:
                 attach_import_node(node, modname, name)
+            else:
+                attach_dummy_node(node, name, member)
             return True
         return False
 
@@ -413,8 +546,20 @@ class InspectBuilder:
 _CONST_PROXY = {}
 
 # TODO : find a nicer way to handle this situation;
-def _set_proxied(const):
-    return _CONST_PROXY[const.value.__class__]
+class _ConstProxied:
+    """non-data descriptor lazily resolving the class proxied by a Const
+
+    The resolved proxy is cached in the instance dict, so only the first
+    access pays the _CONST_PROXY lookup; being a non-data descriptor, later
+    reads find the instance attribute directly.
+    """
+
+    def __get__(self, const, cls=None):
+        if const is None:
+            return self
+        proxy = _CONST_PROXY[const.value.__class__]
+        const.__dict__["_proxied"] = proxy
+        return proxy
 
 
 def _astroid_bootstrapping():
@@ -425,6 +570,7 @@ def _astroid_bootstrapping():
     astroid_builtin = builder.inspect_build(builtins)
 
     # pylint: disable=redefined-outer-name
+    builtin_locals = astroid_builtin.locals
     for cls, node_cls in node_classes.CONST_CLS.items():
         if cls is TYPE_NONE:
             proxy = build_class("NoneType")
@@ -436,14 +582,14 @@ def _astroid_bootstrapping():
             proxy = build_class("Ellipsis")
             proxy.parent = astroid_builtin
         else:
-            proxy = astroid_builtin.getattr(cls.__name__)[0]
+            proxy = builtin_locals[cls.__name__][0]
         if cls in (dict, list, set, tuple):
             node_cls._proxied = proxy
         else:
             _CONST_PROXY[cls] = proxy
 
     # Set the builtin module as parent for some builtins.
-    nodes.Const._proxied = property(_set_proxied)
+    nodes.Const._proxied = _ConstProxied()
 
     _GeneratorType = nodes.ClassDef(
         types.GeneratorType.__name__, types.GeneratorType.__doc__